@@ -75,6 +75,7 @@ Be realistic with scores based on market position and maturity."""
         analysis = json.loads(json_text)
         
         # Build enriched tool
+        now_iso = datetime.now().isoformat()
         enriched_tool = {
             "name": tool_name,
             "description": analysis.get("description", ""),
@@ -90,8 +91,8 @@ Be realistic with scores based on market position and maturity."""
             "features": analysis.get("features", []),
             "source": tool_candidate.get("source", "forum_discovery"),
             "buzz_score": tool_candidate.get("buzz_score", 50),
-            "discovered_at": datetime.now().isoformat(),
-            "added_date": datetime.now().isoformat()
+            "discovered_at": now_iso,
+            "added_date": now_iso
         }
         
         logger.info(f"✅ Analyzed {tool_name}: {enriched_tool['quadrant']} ({enriched_tool['vision']}/{enriched_tool['ability']})")
@@ -127,15 +128,20 @@ def filter_qualified_candidates(analyzed_candidates, config):
     """
     qualified = []
     
+    thresholds = config["thresholds"]
+    min_vision = thresholds["min_vision"]
+    min_ability = thresholds["min_ability"]
+    min_buzz = thresholds["min_buzz_score"]
+    
     for tool in analyzed_candidates:
         vision = tool.get("vision", 0)
         ability = tool.get("ability", 0)
         buzz_score = tool.get("buzz_score", 0)
         
         # Must meet vision/ability minimums AND have good buzz
-        if (vision >= config["thresholds"]["min_vision"] and
-            ability >= config["thresholds"]["min_ability"] and
-            buzz_score >= config["thresholds"]["min_buzz_score"]):
+        if (vision >= min_vision and
+            ability >= min_ability and
+            buzz_score >= min_buzz):
             
             qualified.append(tool)
             logger.info(f"✅ QUALIFIED: {tool['name']} (Vision: {vision}, Ability: {ability}, Buzz: {buzz_score})")
@@ -50,7 +50,7 @@ from utils.scoring_v4 import score_all_tools, calculate_buzz_score, calculate_vi
 # Import scraper sources
 from sources.official_sites import scrape_official_sites
 from sources.forums import scrape_forums
-from sources.social_media import scrape_social_media
+from sources.social_media import scrape_social_media_sync
 
 print("\n🚀 AI Tools Tracker - OPTIMIZED SCRAPER v4.1 (FIXED)...")
 print(f"⏰ Started at: {datetime.now().isoformat()}")
@@ -121,7 +121,7 @@ try:
     # Scrape social media
     logger.info(" 🐦 Scraping social media (ProductHunt, GitHub Trending)...")
     try:
-        social_updates = scrape_social_media(config)
+        social_updates = scrape_social_media_sync(config)
         logger.info(f" Found {len(social_updates)} updates from social media")
         all_candidates.extend(social_updates)
     except Exception as e:
@@ -339,11 +339,12 @@ try:
     overrides_file = 'manual_overrides.json'
     if os.path.exists(overrides_file):
         overrides = load_json(overrides_file)
+        # First index of each tool name (dict lookup instead of a scan per override)
+        tool_index = {}
+        for i, t in enumerate(merged_tools):
+            tool_index.setdefault(t['name'], i)
         for override in overrides:
-            tool_idx = next(
-                (i for i, t in enumerate(merged_tools) if t['name'] == override['name']),
-                None
-            )
+            tool_idx = tool_index.get(override['name'])
             if tool_idx is not None:
                 merged_tools[tool_idx].update(override)
                 logger.info(f" ✅ Applied override for {override['name']}")
@@ -495,7 +496,7 @@ print(" - Maturity: Production (+10), Beta (-5), Alpha (-10)\n")
 
 try:
     # Score all tools (recalculate with enriched data + apply multipliers)
-    merged_tools = score_all_tools(merged_tools)
+    merged_tools = score_all_tools(merged_tools, sort=True)
     
     logger.info(f"\n✅ All tools scored and ranked")
     
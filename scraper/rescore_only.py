@@ -49,7 +49,7 @@ def main():
 
     # STEP 3: Score all tools (calculates final scores + ensures uniqueness)
     logger.info("🎯 Calculating final scores and ensuring uniqueness...\n")
-    tools = score_all_tools(tools)
+    tools = score_all_tools(tools, sort=True)
 
     # STEP 4: Save
     data['tools'] = tools
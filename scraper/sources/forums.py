@@ -2,21 +2,130 @@
 """
 Forums Scraper - RAW DATA VERSION (no scoring)
 Reddit + HackerNews RSS - returns raw data, scoring done in main.py
+
+Feeds are fetched conditionally (ETag / Last-Modified) using scraper/cache/feeds_cache.json.
+The file is local-only: CI starts from a fresh checkout, so conditional GETs only help local runs
 """
 
 import feedparser
 import logging
+import re
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from utils.helpers import load_json, save_json
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+HEADERS = {
+    "User-Agent": "AI-Tools-Tracker/1.0",
+}
+
+HACKER_NEWS_RSS = "https://news.ycombinator.com/rss"
+MAX_FEED_WORKERS = 8
+REQUEST_TIMEOUT = 10
+
+# Only the first ~10 entries are used - cap the bytes downloaded and parsed per feed
+MAX_FEED_BYTES = 256 * 1024
+
+# ETag / Last-Modified + candidates per feed URL, for conditional requests (cleared by FORCE_REFRESH)
+CACHE_DIR = Path(__file__).resolve().parent.parent / "cache"
+FEED_CACHE_FILE = CACHE_DIR / "feeds_cache.json"
+
+REDDIT_KEYWORDS = ("tool", "ai", "gpt", "claude", "model", "new", "release", "framework")
+HN_KEYWORDS = ("ai", "llm", "tool", "framework", "model", "open source", "gpt")
+
+def _build_keyword_matcher(keywords):
+    """
+    Returns text -> True if any keyword occurs in text (case-insensitive substring match)
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise one
+    precompiled regex alternation - either way a single scan for all keywords
+    """
+    if ahocorasick is None:
+        pattern = re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+        return lambda text: pattern.search(text) is not None
+    
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text.lower()), None) is not None
+
+_has_reddit_keyword = _build_keyword_matcher(REDDIT_KEYWORDS)
+_has_hn_keyword = _build_keyword_matcher(HN_KEYWORDS)
+
+def _load_feed_cache():
+    """Load per-feed validators and candidates from the last run"""
+    if not FEED_CACHE_FILE.exists():
+        return {}
+    return load_json(FEED_CACHE_FILE)
+
+def _save_feed_cache(feed_cache):
+    """Persist per-feed validators and candidates for the next run"""
+    save_json(feed_cache, FEED_CACHE_FILE)
+
+def _fetch_feed(url, cached=None):
+    """
+    Conditionally download at most MAX_FEED_BYTES of a feed and parse it
+    Returns (feed, validators) - feed is None on 304 Not Modified (reuse cached candidates)
+    feedparser is lenient with the truncated tail, so entries before the cut are kept
+    """
+    headers = dict(HEADERS)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    
+    with requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as response:
+        if response.status_code == 304 and cached:
+            return None, cached
+        response.raise_for_status()
+        body = response.raw.read(MAX_FEED_BYTES, decode_content=True)
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+    return feedparser.parse(body), validators
+
+def _feed_candidates(feed, limit, has_keyword, source_id, category):
+    """RAW candidates from the first `limit` entries whose title mentions a keyword"""
+    found = []
+    
+    for entry in feed.entries[:limit]:
+        title = entry.get("title", "")
+        
+        # Filter for AI/tool mentions
+        if has_keyword(title):
+            # ONLY RAW DATA - no scoring!
+            candidate = {
+                "name": title[:80],
+                "source": source_id,
+                "url": entry.get("link", ""),
+                "description": title,  # Use title as description
+                "category": category,
+                # NO buzz_score, vision, ability here!
+            }
+            
+            found.append(candidate)
+            logger.info(f"     ✅ {title[:50]}")
+    
+    return found
+
 def scrape_forums(config):
     """Scrape forums for AI tool mentions - RSS feeds with RAW data only"""
     candidates = []
     
     logger.info("💬 Scraping forums (Reddit + HackerNews RSS)...\n")
     
-    # ===== REDDIT RSS =====
+    # ===== REDDIT + HACKER NEWS RSS =====
     reddit_subreddits = [
         "r/MachineLearning",
         "r/LanguageModels",
@@ -25,60 +134,36 @@ def scrape_forums(config):
         "r/OpenAI",
     ]
     
-    for subreddit in reddit_subreddits:
+    # (name, log label, url, entries to scan, keyword matcher, source id, category)
+    feeds = [
+        (subreddit, f"  📖 {subreddit}...", f"https://www.reddit.com/{subreddit}/.rss", 8,
+         _has_reddit_keyword, subreddit.replace("r/", "reddit_"), "Community Discussion")
+        for subreddit in reddit_subreddits
+    ]
+    feeds.append(("Hacker News", "\n  📰 Hacker News...", HACKER_NEWS_RSS, 10, _has_hn_keyword, "hacker_news", "Community"))
+    
+    # Feeds are network-bound and independent: fetch them all concurrently, process in order
+    feed_cache = _load_feed_cache()
+    with ThreadPoolExecutor(max_workers=min(MAX_FEED_WORKERS, len(feeds))) as pool:
+        fetches = [pool.submit(_fetch_feed, feed[2], feed_cache.get(feed[2])) for feed in feeds]
+    
+    for (name, label, url, limit, has_keyword, source_id, category), fetch in zip(feeds, fetches):
         try:
-            rss_url = f"https://www.reddit.com/{subreddit}/.rss"
-            logger.info(f"  📖 {subreddit}...")
+            logger.info(label)
             
-            feed = feedparser.parse(rss_url)
+            feed, validators = fetch.result()
+            if feed is None:
+                found = validators.get("candidates", [])
+                logger.info(f"     ♻️  Not modified - reusing {len(found)} cached candidates")
+            else:
+                found = _feed_candidates(feed, limit, has_keyword, source_id, category)
+                feed_cache[url] = {**validators, "candidates": found}
             
-            for entry in feed.entries[:8]:
-                title = entry.get("title", "")
-                link = entry.get("link", "")
-                
-                # Filter for AI/tool mentions
-                if any(kw in title.lower() for kw in ["tool", "ai", "gpt", "claude", "model", "new", "release", "framework"]):
-                    source_id = subreddit.replace("r/", "reddit_")
-                    
-                    # ONLY RAW DATA - no scoring!
-                    candidate = {
-                        "name": title[:80],
-                        "source": source_id,
-                        "url": link,
-                        "description": title,  # Use title as description
-                        "category": "Community Discussion",
-                        # NO buzz_score, vision, ability here!
-                    }
-                    
-                    candidates.append(candidate)
-                    logger.info(f"     ✅ {title[:50]}")
+            candidates.extend(found)
         except Exception as e:
-            logger.warning(f"  Error scraping {subreddit}: {e}")
+            logger.warning(f"  Error scraping {name}: {e}")
     
-    # ===== HACKER NEWS RSS =====
-    try:
-        logger.info(f"\n  📰 Hacker News...")
-        rss_url = "https://news.ycombinator.com/rss"
-        feed = feedparser.parse(rss_url)
-        
-        for entry in feed.entries[:10]:
-            title = entry.get("title", "")
-            link = entry.get("link", "")
-            
-            if any(kw in title.lower() for kw in ["ai", "llm", "tool", "framework", "model", "open source", "gpt"]):
-                candidate = {
-                    "name": title[:80],
-                    "source": "hacker_news",
-                    "url": link,
-                    "description": title,
-                    "category": "Community",
-                    # NO buzz_score, vision, ability here!
-                }
-                
-                candidates.append(candidate)
-                logger.info(f"     ✅ {title[:50]}")
-    except Exception as e:
-        logger.warning(f"  Error scraping Hacker News: {e}")
+    _save_feed_cache(feed_cache)
     
     logger.info(f"\n✅ Forums scraping complete: {len(candidates)} candidates found\n")
-    return candidates
\ No newline at end of file
+    return candidates
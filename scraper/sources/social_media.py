@@ -4,9 +4,10 @@ Social Media Scraper - RAW DATA VERSION (no scoring)
 Product Hunt + GitHub Trending - returns raw data, scoring done in main.py
 """
 
+import asyncio
 import feedparser
-import requests
 import logging
+import aiohttp
 from bs4 import BeautifulSoup
 
 logging.basicConfig(level=logging.INFO)
@@ -16,17 +17,23 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
 }
 
-def scrape_social_media(config):
-    """Scrape Product Hunt + GitHub Trending with RAW data only"""
+PRODUCT_HUNT_RSS = "https://www.producthunt.com/feed.xml"
+GITHUB_TRENDING_URL = "https://github.com/trending?since=weekly"
+REQUEST_TIMEOUT = 10
+
+async def _fetch_producthunt(session):
+    """Fetch Product Hunt RSS and return RAW candidates"""
     candidates = []
     
-    logger.info("🐦 Scraping social media & trending sources...\n")
-    
-    # ===== PRODUCT HUNT RSS =====
     try:
         logger.info("  🚀 Product Hunt RSS...")
-        rss_url = "https://www.producthunt.com/feed.xml"
-        feed = feedparser.parse(rss_url)
+        async with session.get(PRODUCT_HUNT_RSS) as response:
+            if response.status != 200:
+                logger.warning(f"  Product Hunt returned {response.status}")
+                return candidates
+            body = await response.read()
+        
+        feed = feedparser.parse(body)
         
         for entry in feed.entries[:12]:
             title = entry.get("title", "")
@@ -49,61 +56,88 @@ def scrape_social_media(config):
     except Exception as e:
         logger.warning(f"  Error scraping Product Hunt: {e}")
     
-    # ===== GITHUB TRENDING =====
+    return candidates
+
+async def _fetch_github_trending(session):
+    """Fetch GitHub Trending page and return RAW candidates"""
+    candidates = []
+    
     try:
-        logger.info(f"\n  ⭐ GitHub Trending...")
-        url = "https://github.com/trending?since=weekly"
+        logger.info(f"  ⭐ GitHub Trending...")
+        async with session.get(GITHUB_TRENDING_URL) as response:
+            if response.status != 200:
+                logger.warning(f"  GitHub trending returned {response.status}")
+                return candidates
+            html = await response.text()
         
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, "html.parser")
-            articles = soup.find_all("article", class_="Box-row")
-            
-            for article in articles[:15]:
-                try:
-                    h2 = article.find("h2")
-                    if not h2:
-                        continue
-                    
-                    link_elem = h2.find("a")
-                    if not link_elem:
-                        continue
-                    
-                    repo_name = link_elem.get_text(strip=True).replace("\n", "").strip()
-                    repo_url = "https://github.com" + link_elem.get("href", "")
-                    
-                    desc_elem = article.find("p", class_="col-9")
-                    description = desc_elem.get_text(strip=True) if desc_elem else ""
-                    
-                    # Try to extract stars
-                    stars_elem = article.find("span", class_="d-inline-block float-sm-right")
-                    github_stars = 0
-                    if stars_elem:
-                        stars_text = stars_elem.get_text(strip=True).replace(",", "")
-                        try:
-                            github_stars = int(stars_text)
-                        except:
-                            pass
-                    
-                    candidate = {
-                        "name": repo_name,
-                        "description": description[:150] if description else "",
-                        "source": "github_trending",
-                        "url": repo_url,
-                        "github_url": repo_url,
-                        "github_stars": github_stars,  # RAW data for scoring
-                        "category": "Open Source",
-                        # NO scores here!
-                    }
-                    
-                    candidates.append(candidate)
-                    logger.info(f"     ✅ {repo_name}")
-                except Exception as e:
-                    logger.debug(f"Error parsing GitHub repo: {e}")
-        else:
-            logger.warning(f"  GitHub trending returned {response.status_code}")
+        soup = BeautifulSoup(html, "html.parser")
+        articles = soup.find_all("article", class_="Box-row")
+        
+        for article in articles[:15]:
+            try:
+                h2 = article.find("h2")
+                if not h2:
+                    continue
+                
+                link_elem = h2.find("a")
+                if not link_elem:
+                    continue
+                
+                repo_name = link_elem.get_text(strip=True).replace("\n", "").strip()
+                repo_url = "https://github.com" + link_elem.get("href", "")
+                
+                desc_elem = article.find("p", class_="col-9")
+                description = desc_elem.get_text(strip=True) if desc_elem else ""
+                
+                # Try to extract stars
+                stars_elem = article.find("span", class_="d-inline-block float-sm-right")
+                github_stars = 0
+                if stars_elem:
+                    stars_text = stars_elem.get_text(strip=True).replace(",", "")
+                    try:
+                        github_stars = int(stars_text)
+                    except:
+                        pass
+                
+                candidate = {
+                    "name": repo_name,
+                    "description": description[:150] if description else "",
+                    "source": "github_trending",
+                    "url": repo_url,
+                    "github_url": repo_url,
+                    "github_stars": github_stars,  # RAW data for scoring
+                    "category": "Open Source",
+                    # NO scores here!
+                }
+                
+                candidates.append(candidate)
+                logger.info(f"     ✅ {repo_name}")
+            except Exception as e:
+                logger.debug(f"Error parsing GitHub repo: {e}")
     except Exception as e:
         logger.warning(f"  Error scraping GitHub: {e}")
     
+    return candidates
+
+async def scrape_social_media(config):
+    """
+    Scrape Product Hunt + GitHub Trending with RAW data only
+    Both sources are independent, so they are fetched concurrently
+    """
+    logger.info("🐦 Scraping social media & trending sources...\n")
+    
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
+        producthunt, github_trending = await asyncio.gather(
+            _fetch_producthunt(session),
+            _fetch_github_trending(session),
+        )
+    
+    candidates = producthunt + github_trending
+    
     logger.info(f"\n✅ Social media scraping complete: {len(candidates)} candidates found\n")
-    return candidates
\ No newline at end of file
+    return candidates
+
+def scrape_social_media_sync(config):
+    """Synchronous entry point for callers outside an event loop"""
+    return asyncio.run(scrape_social_media(config))
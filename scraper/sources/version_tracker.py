@@ -8,6 +8,7 @@ FEATURES:
 - Official blog scraping (company announcements)
 - Smart fallback to Perplexity (only if needed)
 - Semantic version comparison (major/minor detection)
+- Concurrent batch tracking with per-host rate limiting
 
 COST OPTIMIZATION:
 - GitHub API: Free (5000 req/hour)
@@ -16,10 +17,15 @@ COST OPTIMIZATION:
 """
 
 import logging
+import random
 import re
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Dict, Tuple
+from urllib.parse import urlparse
 from packaging import version
 import feedparser
 from bs4 import BeautifulSoup
@@ -35,6 +41,11 @@ GITHUB_API_BASE = "https://api.github.com"
 REQUEST_TIMEOUT = 10
 USER_AGENT = "AI-Tools-Tracker/1.0"
 
+# Politeness settings (many tools share github.com / api.github.com / blog hosts)
+MAX_WORKERS = 8
+MAX_REQUESTS_PER_HOST = 4
+POLITE_DELAY_RANGE = (0.1, 0.5)  # seconds, jittered, non-API hosts only
+
 # Version patterns (common formats)
 VERSION_PATTERNS = [
     r'v?(\d+\.\d+(?:\.\d+)?)',  # v1.2.3 or 1.2.3
@@ -42,6 +53,93 @@ VERSION_PATTERNS = [
     r'release\s+(\d+\.\d+(?:\.\d+)?)',  # release 1.2.3
 ]
 
+# Statistics keys for track_all_tools (homepage_* sources handled by prefix)
+_SOURCE_TO_STAT = {
+    "github": "found_via_github",
+    "github_tags": "found_via_github",
+    "changelog": "found_via_changelog",
+    "blog_rss": "found_via_blog",
+}
+_UPDATE_TYPE_TO_STAT = {
+    "major": "major_updates",
+    "minor": "minor_updates",
+    "patch": "patch_updates",
+}
+
+# Pre-release suffix stripped before comparison (1.2.0-beta.1 -> 1.2.0)
+_PRERELEASE_RE = re.compile(r'[-_](?:alpha|beta|rc|dev).*$', re.IGNORECASE)
+
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+_host_sems: Dict[str, threading.BoundedSemaphore] = {}
+_host_sems_lock = threading.Lock()
+
+# Epoch seconds until which api.github.com calls are skipped (quota exhausted)
+_github_reset_at = 0.0
+_github_reset_lock = threading.Lock()
+
+class GitHubRateLimited(requests.RequestException):
+    """api.github.com quota is exhausted until X-RateLimit-Reset"""
+
+def _sem_for(url: str) -> threading.BoundedSemaphore:
+    """Get the per-host semaphore for a URL (created on first use)"""
+    host = urlparse(url).netloc
+    with _host_sems_lock:
+        return _host_sems.setdefault(host, threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST))
+
+def _note_github_rate_limit(response: requests.Response) -> None:
+    """Record X-RateLimit-Reset once the quota is used up (logged once per window)"""
+    global _github_reset_at
+    
+    if response.headers.get("X-RateLimit-Remaining") != "0":
+        return
+    
+    reset_at = float(response.headers.get("X-RateLimit-Reset", "0"))
+    with _github_reset_lock:
+        if reset_at > _github_reset_at:
+            _github_reset_at = reset_at
+            wait = max(0, reset_at - time.time())
+            logger.warning(f"  ⏳ GitHub rate limit reached, skipping GitHub API for {wait:.0f}s")
+
+def _polite_get(url: str) -> requests.Response:
+    """
+    GET with per-host concurrency limit
+    
+    - Non-API hosts: jittered delay before each request
+    - api.github.com: raises GitHubRateLimited instead of calling while the quota
+      is exhausted, or when the response itself is a rate-limit rejection
+    """
+    host = urlparse(url).netloc
+    is_github_api = host == "api.github.com"
+    
+    if is_github_api and time.time() < _github_reset_at:
+        raise GitHubRateLimited(f"GitHub API rate limited, skipping {url}")
+    
+    with _sem_for(url):
+        if not is_github_api:
+            time.sleep(random.uniform(*POLITE_DELAY_RANGE))
+        
+        response = requests.get(
+            url,
+            headers={"User-Agent": USER_AGENT},
+            timeout=REQUEST_TIMEOUT
+        )
+    
+    if is_github_api:
+        _note_github_rate_limit(response)
+        if response.status_code in (403, 429) and time.time() < _github_reset_at:
+            raise GitHubRateLimited(f"GitHub API rate limited ({response.status_code}) for {url}")
+    
+    return response
+
+def _polite_parse_feed(url: str):
+    """feedparser.parse under the same per-host limit and delay as _polite_get"""
+    with _sem_for(url):
+        time.sleep(random.uniform(*POLITE_DELAY_RANGE))
+        return feedparser.parse(url)
+
 # ============================================================================
 # MAIN VERSION TRACKING
 # ============================================================================
@@ -164,11 +262,7 @@ def _check_github_release(github_url: str, tool_name: str) -> Tuple[Optional[str
         
         # Call GitHub API
         api_url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases/latest"
-        response = requests.get(
-            api_url,
-            headers={"User-Agent": USER_AGENT},
-            timeout=REQUEST_TIMEOUT
-        )
+        response = _polite_get(api_url)
         
         if response.status_code == 200:
             data = response.json()
@@ -199,11 +293,7 @@ def _check_github_tags(owner: str, repo: str) -> Tuple[Optional[str], str, Dict]
     
     try:
         api_url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/tags"
-        response = requests.get(
-            api_url,
-            headers={"User-Agent": USER_AGENT},
-            timeout=REQUEST_TIMEOUT
-        )
+        response = _polite_get(api_url)
         
         if response.status_code == 200:
             tags = response.json()
@@ -232,11 +322,7 @@ def _check_changelog_page(changelog_url: str, tool_name: str) -> Tuple[Optional[
     """
     
     try:
-        response = requests.get(
-            changelog_url,
-            headers={"User-Agent": USER_AGENT},
-            timeout=REQUEST_TIMEOUT
-        )
+        response = _polite_get(changelog_url)
         
         if response.status_code != 200:
             return None, "changelog", {}
@@ -300,7 +386,7 @@ def _check_blog_rss(blog_url: str, tool_name: str) -> Tuple[Optional[str], str,
     
     for rss_url in rss_urls:
         try:
-            feed = feedparser.parse(rss_url)
+            feed = _polite_parse_feed(rss_url)
             
             if not feed.entries:
                 continue
@@ -347,11 +433,7 @@ def _scrape_homepage_version(url: str, tool_name: str) -> Tuple[Optional[str], s
     """
     
     try:
-        response = requests.get(
-            url,
-            headers={"User-Agent": USER_AGENT},
-            timeout=REQUEST_TIMEOUT
-        )
+        response = _polite_get(url)
         
         if response.status_code != 200:
             return None, "homepage", {}
@@ -398,8 +480,9 @@ def _clean_version(version_str: str) -> str:
     # Remove 'v' prefix
     cleaned = version_str.lstrip('vV')
     
-    # Remove non-numeric suffixes (beta, rc, etc)
-    cleaned = re.sub(r'[-_](alpha|beta|rc|dev).*$', '', cleaned, flags=re.IGNORECASE)
+    # Remove non-numeric suffixes (beta, rc, etc) - stable releases skip the regex
+    if '-' in cleaned or '_' in cleaned:
+        cleaned = _PRERELEASE_RE.sub('', cleaned)
     
     return cleaned
 
@@ -452,13 +535,16 @@ def track_all_tools(tools: list) -> Dict:
         }
     }
     
-    for tool in tools:
+    stats = results["statistics"]
+    
+    # Fetch concurrently (per-host limits in _polite_get), aggregate in order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        tracked = list(pool.map(track_tool_version, tools))
+    
+    for tool, (new_version, source, metadata) in zip(tools, tracked):
         tool_name = tool.get("name", "Unknown")
         old_version = tool.get("last_known_version", "0.0.0")
         
-        # Track version
-        new_version, source, metadata = track_tool_version(tool)
-        
         if new_version and new_version != old_version:
             # Compare versions
             update_type, is_major = compare_versions(old_version, new_version)
@@ -474,35 +560,26 @@ def track_all_tools(tools: list) -> Dict:
             })
             
             # Update stats
-            if update_type == "major":
-                results["statistics"]["major_updates"] += 1
-            elif update_type == "minor":
-                results["statistics"]["minor_updates"] += 1
-            elif update_type == "patch":
-                results["statistics"]["patch_updates"] += 1
+            update_key = _UPDATE_TYPE_TO_STAT.get(update_type)
+            if update_key:
+                stats[update_key] += 1
         
         elif source == "needs_perplexity":
             results["needs_perplexity"].append({
                 "name": tool_name,
                 "url": tool.get("url")
             })
-            results["statistics"]["needs_perplexity"] += 1
+            stats["needs_perplexity"] += 1
         
         else:
             results["no_change"].append(tool_name)
         
         # Track source statistics
-        if source == "github":
-            results["statistics"]["found_via_github"] += 1
-        elif source == "changelog":
-            results["statistics"]["found_via_changelog"] += 1
-        elif source == "blog_rss":
-            results["statistics"]["found_via_blog"] += 1
-        elif source.startswith("homepage"):
-            results["statistics"]["found_via_homepage"] += 1
+        source_key = _SOURCE_TO_STAT.get(source) or ("found_via_homepage" if source.startswith("homepage") else None)
+        if source_key:
+            stats[source_key] += 1
     
     # Log summary
-    stats = results["statistics"]
     logger.info(f"\n📊 VERSION TRACKING SUMMARY:")
     logger.info(f"   Total tools: {stats['total']}")
     logger.info(f"   Updated: {len(results['updated_tools'])} ({len(results['updated_tools'])/stats['total']*100:.1f}%)")
@@ -3,17 +3,35 @@ Helper utilities for scraper - ENHANCED
 Now with proper IMMUTABLE vs EVOLVING field handling
 """
 
+import heapq
 import json
+import mmap
+import os
+import tempfile
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, List, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ============ PATHS ============
+
+_HERE = Path(__file__).resolve().parent
+CONFIG_PATH = _HERE.parent / "config.json"
+TOOLS_PATH = _HERE.parent.parent / "public" / "ai_tracker_enhanced.json"
+TOOLS_DIR = TOOLS_PATH.parent
+
 # ============ FIELD CATEGORIZATION ============
 
-IMMUTABLE_FIELDS = {
+IMMUTABLE_FIELDS = frozenset({
     # Never overwrite - core identity
     "name",
     "category",
@@ -26,9 +44,9 @@ IMMUTABLE_FIELDS = {
     "twitter_handle",  # Usually doesn't change
     "discord_server",  # Usually doesn't change
     "reddit"  # Usually doesn't change
-}
+})
 
-EVOLVING_FIELDS = {
+EVOLVING_FIELDS = frozenset({
     # Always update from Perplexity if new data available
     "status",  # active → beta → discontinued
     "pricing",  # Can change (free → paid)
@@ -40,16 +58,81 @@ EVOLVING_FIELDS = {
     "pricing_tiers",  # Pricing details change
     "user_base",  # Grows over time
     "founding_year"  # Only if currently empty
-}
+})
 
-FILL_IF_EMPTY = {
+FILL_IF_EMPTY = frozenset({
     # Fill if empty, but don't overwrite existing
     "description",
     "website_description"
-}
+})
+
+# Statuses dropped by finalize_tools
+_LEGACY_STATUSES = frozenset({"discontinued", "legacy", "replaced"})
 
 # ============ CORE JSON FUNCTIONS ============
 
+# Below this size a plain read() beats mmap setup cost
+MMAP_MIN_SIZE = 64 * 1024
+
+def _json_loads(raw):
+    """Parse JSON bytes - orjson when installed, stdlib json otherwise"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _json_dumps(data):
+    """
+    Serialize to indented UTF-8 JSON bytes - orjson when installed, stdlib json otherwise
+    Both write non-ASCII as raw UTF-8 (no \\uXXXX escapes); orjson also writes exponents
+    as 1e16 / 1e-7 (stdlib: 1e+16 / 1e-07) and NaN/Infinity as null
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+def _read_json_file(path):
+    """
+    Parse a JSON file from disk
+    Large files are mmapped and handed to orjson as a buffer (no intermediate bytes copy)
+    """
+    with open(path, "rb") as f:
+        if orjson is None or path.stat().st_size <= MMAP_MIN_SIZE:
+            return _json_loads(f.read())
+        
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+                mm.madvise(mmap.MADV_WILLNEED)
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
+        finally:
+            mm.close()
+
+def _write_atomic(path, buf):
+    """
+    Write bytes to path atomically: temp file in the same directory, fsync, os.replace
+    A crash mid-write leaves the previous file intact instead of truncated JSON
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as tf:
+        tmp_name = tf.name
+        try:
+            tf.write(buf)
+            tf.flush()
+            os.fsync(tf.fileno())
+            # NamedTemporaryFile is 0600 - keep the permissions of the file being replaced
+            os.chmod(tmp_name, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        except BaseException:
+            tf.close()
+            os.unlink(tmp_name)
+            raise
+    
+    try:
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
 def load_json(filepath):
     """Load any JSON file - Generic helper"""
     try:
@@ -58,8 +141,8 @@ def load_json(filepath):
             logger.warning(f"File not found: {filepath}")
             return {}
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(path, 'rb') as f:
+            data = _json_loads(f.read())
         logger.info(f"✅ Loaded JSON from {filepath}")
         return data
     except Exception as e:
@@ -72,8 +155,7 @@ def save_json(data, filepath):
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _write_atomic(path, _json_dumps(data))
         logger.info(f"✅ Saved JSON to {filepath}")
         return True
     except Exception as e:
@@ -84,42 +166,40 @@ def save_json(data, filepath):
 
 def load_config():
     """Load scraper configuration"""
-    config_path = Path(__file__).parent.parent / "config.json"
     try:
-        with open(config_path, "r") as f:
-            config_data = json.load(f)
-        return config_data["scraping_config"]
+        with open(CONFIG_PATH, "rb") as f:
+            return _json_loads(f.read())["scraping_config"]
     except Exception as e:
         print(f"Error loading config: {e}")
         return {"tools_to_track": [], "sources": {}, "thresholds": {}}
 
 def load_tools_json():
     """Load current tools JSON"""
-    tools_path = Path(__file__).parent.parent.parent / "public" / "ai_tracker_enhanced.json"
-    
-    if not tools_path.exists():
+    if not TOOLS_PATH.exists():
         return {"tools": []}
     
     try:
-        with open(tools_path, "r") as f:
-            return json.load(f)
+        return _read_json_file(TOOLS_PATH)
     except Exception as e:
         print(f"Error loading tools JSON: {e}")
         return {"tools": []}
 
 def save_tools_json(tools_data):
     """Save updated tools JSON"""
-    tools_path = Path(__file__).parent.parent.parent / "public" / "ai_tracker_enhanced.json"
-    tools_path.parent.mkdir(parents=True, exist_ok=True)
+    TOOLS_DIR.mkdir(parents=True, exist_ok=True)
     
     try:
-        with open(tools_path, "w") as f:
-            json.dump(tools_data, f, indent=2)
-        logger.info(f"✅ Saved {len(tools_data.get('tools', []))} tools to ai_tracker_enhanced.json")
+        buf = _json_dumps(tools_data)
+        _write_atomic(TOOLS_PATH, buf)
+        logger.info(f"✅ Saved {len(tools_data.get('tools', []))} tools to ai_tracker_enhanced.json ({len(buf)} bytes)")
     except Exception as e:
         logger.error(f"Error saving tools JSON: {e}")
 
-def merge_intelligently(existing_tools, enriched_data):
+def merge_intelligently(
+    existing_tools: List[Dict[str, Any]],
+    enriched_data: List[Dict[str, Any]],
+    record_details: bool = True
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     """
     INTELLIGENT MERGE with field categorization
     
@@ -128,10 +208,15 @@ def merge_intelligently(existing_tools, enriched_data):
     ♻️ EVOLVING fields: ALWAYS update from enriched data
     ❌ FILL_IF_EMPTY: Only fill if currently empty
     
+    record_details=False skips the old/new value snapshots and the
+    per-tool detailed_changes (change entries hold field names only)
+    
     Returns: (merged_tools, change_log)
     """
+    # One timestamp for the whole merge
+    now_iso = datetime.now().isoformat()
     change_log = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso,
         "total_tools": len(existing_tools),
         "immutable_preserved": [],
         "evolving_updated": [],
@@ -140,12 +225,14 @@ def merge_intelligently(existing_tools, enriched_data):
         "detailed_changes": {}
     }
     
-    merged_tools = []
+    merged_tools: List[Dict[str, Any]] = []
+    
+    # Per-field logs are only formatted when INFO is enabled
+    log_info = logger.isEnabledFor(logging.INFO)
     
-    # Create dict of enriched data by tool name
-    enriched_dict = {}
-    for tool in enriched_data:
-        enriched_dict[tool.get("name", "")] = tool
+    # Index enriched data and existing names once
+    enriched_dict: Dict[str, Dict[str, Any]] = {tool.get("name", ""): tool for tool in enriched_data}
+    existing_names = {tool.get("name") for tool in existing_tools}
     
     # ========== PROCESS EXISTING TOOLS ==========
     for existing_tool in existing_tools:
@@ -160,8 +247,11 @@ def merge_intelligently(existing_tools, enriched_data):
         # Get enriched data if available
         enriched = enriched_dict.get(tool_name, {})
         
+        # Only visit categorized fields the enriched record actually has
+        enriched_keys = enriched.keys()
+        
         # ✅ IMMUTABLE FIELDS - never change
-        for field in IMMUTABLE_FIELDS:
+        for field in enriched_keys & IMMUTABLE_FIELDS:
             if field in merged_tool:
                 # Keep existing value - verify it's not overwritten
                 if enriched.get(field) and enriched.get(field) != merged_tool.get(field):
@@ -169,7 +259,7 @@ def merge_intelligently(existing_tools, enriched_data):
                     tool_changes["immutable"].append(field)
         
         # ♻️ EVOLVING FIELDS - update if new data available
-        for field in EVOLVING_FIELDS:
+        for field in enriched_keys & EVOLVING_FIELDS:
             if enriched.get(field):
                 old_val = merged_tool.get(field)
                 new_val = enriched.get(field)
@@ -177,26 +267,34 @@ def merge_intelligently(existing_tools, enriched_data):
                 # Only update if different
                 if old_val != new_val:
                     merged_tool[field] = new_val
-                    tool_changes["evolved"].append({
-                        "field": field,
-                        "old": str(old_val)[:50],
-                        "new": str(new_val)[:50]
-                    })
-                    logger.info(f"♻️ Updated {tool_name} - {field}")
+                    if record_details:
+                        tool_changes["evolved"].append({
+                            "field": field,
+                            "old": str(old_val)[:50],
+                            "new": str(new_val)[:50]
+                        })
+                    else:
+                        tool_changes["evolved"].append(field)
+                    if log_info:
+                        logger.info(f"♻️ Updated {tool_name} - {field}")
         
         # ❌ FILL_IF_EMPTY - only if currently empty
-        for field in FILL_IF_EMPTY:
+        for field in enriched_keys & FILL_IF_EMPTY:
             if not merged_tool.get(field) and enriched.get(field):
                 merged_tool[field] = enriched.get(field)
-                tool_changes["filled"].append({
-                    "field": field,
-                    "value": str(enriched.get(field))[:50]
-                })
-                logger.info(f"✨ Filled empty {field} for {tool_name}")
+                if record_details:
+                    tool_changes["filled"].append({
+                        "field": field,
+                        "value": str(enriched.get(field))[:50]
+                    })
+                else:
+                    tool_changes["filled"].append(field)
+                if log_info:
+                    logger.info(f"✨ Filled empty {field} for {tool_name}")
         
         # Add last_updated timestamp for evolving data
         if tool_changes["evolved"] or tool_changes["filled"]:
-            merged_tool["last_updated"] = datetime.now().isoformat()
+            merged_tool["last_updated"] = now_iso
         
         # Log changes
         if tool_changes["immutable"]:
@@ -217,18 +315,19 @@ def merge_intelligently(existing_tools, enriched_data):
                 "fields": tool_changes["filled"]
             })
         
-        change_log["detailed_changes"][tool_name] = tool_changes
+        if record_details:
+            change_log["detailed_changes"][tool_name] = tool_changes
         merged_tools.append(merged_tool)
     
     # ========== ADD NEW TOOLS ==========
-    existing_names = {tool.get("name") for tool in existing_tools}
-    for tool in enriched_data:
-        if tool.get("name") not in existing_names:
-            tool["added_date"] = datetime.now().isoformat()
-            tool["last_updated"] = datetime.now().isoformat()
+    for name, tool in enriched_dict.items():
+        if name not in existing_names:
+            tool["added_date"] = now_iso
+            tool["last_updated"] = now_iso
             merged_tools.append(tool)
             change_log["new_tools"].append(tool.get("name"))
-            logger.info(f"➕ Added new tool: {tool.get('name')}")
+            if log_info:
+                logger.info(f"➕ Added new tool: {tool.get('name')}")
     
     # ========== LOG SUMMARY ==========
     logger.info(f"\n📊 INTELLIGENT MERGE SUMMARY:")
@@ -259,19 +358,23 @@ def score_candidates(candidates):
         candidate["quality_score"] = score
         scored.append(candidate)
     
-    return sorted(scored, key=lambda x: x["quality_score"], reverse=True)
+    return sorted(scored, key=itemgetter("quality_score"), reverse=True)
 
 def apply_manual_overrides(tools, overrides_config):
     """Apply manual override configurations"""
+    # Index tools by name once instead of scanning the list per override
+    tools_by_name = {}
+    for tool in tools:
+        tools_by_name.setdefault(tool.get("name"), []).append(tool)
+    
     for override in overrides_config.get("manual_overrides", []):
         tool_name = override.get("name")
-        for tool in tools:
-            if tool.get("name") == tool_name:
-                # Only override if explicitly defined
-                for key, value in override.items():
-                    if key != "name":
-                        tool[key] = value
-                logger.info(f"🔧 Applied manual override for {tool_name}")
+        for tool in tools_by_name.get(tool_name, []):
+            # Only override if explicitly defined
+            for key, value in override.items():
+                if key != "name":
+                    tool[key] = value
+            logger.info(f"🔧 Applied manual override for {tool_name}")
     
     return tools
 
@@ -280,30 +383,62 @@ def remove_legacy_versions(tools):
     tool_groups = {}
     for tool in tools:
         base_name = tool.get("name", "").split(" ")[0]
-        if base_name not in tool_groups:
-            tool_groups[base_name] = []
-        tool_groups[base_name].append(tool)
+        tool_groups.setdefault(base_name, []).append(tool)
     
     filtered_tools = []
     for group in tool_groups.values():
-        sorted_group = sorted(group, key=lambda x: x.get("ability", 0), reverse=True)
-        filtered_tools.extend(sorted_group[:2])
+        # Most groups hold a single tool - nothing to rank
+        if len(group) == 1:
+            filtered_tools.append(group[0])
+            continue
+        # Keep the 2 most able versions (same order as a stable descending sort)
+        filtered_tools.extend(heapq.nlargest(2, group, key=lambda x: x.get("ability", 0)))
     
     logger.info(f"Filtered to {len(filtered_tools)} tools (removed legacy versions)")
     return filtered_tools
 
+def _select_top_tools(tools, max_tools, drop_statuses=frozenset()):
+    """
+    Single pass: skip dropped statuses, score, keep the best max_tools in a bounded min-heap
+    Returns (top_tools sorted by score desc, number of tools dropped by status)
+    """
+    heap = []
+    dropped = 0
+    
+    for i, tool in enumerate(tools):
+        get = tool.get
+        if drop_statuses and (get("status") or "").lower() in drop_statuses:
+            dropped += 1
+            continue
+        
+        # -index breaks ties in input order, like a stable sort
+        entry = ((get("buzz_score", 0) + get("ability", 0)) / 2, -i, tool)
+        if len(heap) < max_tools:
+            heapq.heappush(heap, entry)
+        else:
+            heapq.heappushpop(heap, entry)
+    
+    top = [heapq.heappop(heap)[2] for _ in range(len(heap))]
+    top.reverse()
+    return top, dropped
+
+def finalize_tools(tools, config):
+    """
+    Final cut in one pass: drop discontinued/legacy/replaced tools and keep
+    the top max_tools (config thresholds) by relevance, best first
+    """
+    max_tools = config.get("thresholds", {}).get("max_tools", 150)
+    finalized, dropped = _select_top_tools(tools, max_tools, _LEGACY_STATUSES)
+    
+    logger.info(f"Finalized {len(finalized)} tools (dropped {dropped} legacy, capped at {max_tools})")
+    return finalized
+
 def filter_by_max_tools(tools, max_tools=150):
     """Filter tools to maximum count"""
     if len(tools) <= max_tools:
         return tools
     
-    sorted_tools = sorted(
-        tools,
-        key=lambda x: (x.get("buzz_score", 0) + x.get("ability", 0)) / 2,
-        reverse=True
-    )
-    
-    filtered = sorted_tools[:max_tools]
+    filtered, _ = _select_top_tools(tools, max_tools)
     logger.info(f"Filtered to top {max_tools} tools by relevance")
     return filtered
 
@@ -321,26 +456,32 @@ def export_changelog(old_tools, new_tools):
     old_dict = {t.get("name"): t for t in old_tools}
     new_dict = {t.get("name"): t for t in new_tools}
     
+    # Split names with set ops on the dict views, keeping new_tools order
+    common = new_dict.keys() & old_dict.keys()
+    if len(common) < len(new_dict):
+        changelog["new_tools"] = [name for name in new_dict if name not in common]
+    
     # Track updates
     for name, new_tool in new_dict.items():
-        if name in old_dict:
-            old_tool = old_dict[name]
-            
-            # Check for status change
-            if old_tool.get("status") != new_tool.get("status"):
-                changelog["status_changes"].append({
-                    "tool": name,
-                    "old_status": old_tool.get("status"),
-                    "new_status": new_tool.get("status")
-                })
-            
-            # Check for feature updates
-            if old_tool.get("key_features") != new_tool.get("key_features"):
-                changelog["updated_tools"].append({
-                    "tool": name,
-                    "features_updated": True
-                })
-        else:
-            changelog["new_tools"].append(name)
+        if name not in common:
+            continue
+        old_tool = old_dict[name]
+        old_status = old_tool.get("status")
+        new_status = new_tool.get("status")
+        
+        # Check for status change
+        if old_status != new_status:
+            changelog["status_changes"].append({
+                "tool": name,
+                "old_status": old_status,
+                "new_status": new_status
+            })
+        
+        # Check for feature updates
+        if old_tool.get("key_features") != new_tool.get("key_features"):
+            changelog["updated_tools"].append({
+                "tool": name,
+                "features_updated": True
+            })
     
     return changelog
\ No newline at end of file
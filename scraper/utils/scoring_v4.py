@@ -16,12 +16,21 @@ SCORING DIMENSIONS:
 """
 
 import logging
+import math
+import os
 import re
 import json
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
 from datetime import datetime, timedelta
 
+import numpy as np
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -50,6 +59,10 @@ DIMENSION_WEIGHTS = {
     "adoption": 0.05     # ↓ Hard to measure, often missing data - from 0.15
 }
 
+# Same weights as parallel sequences (summation order = DIMENSION_WEIGHTS order)
+_DIM_ORDER = tuple(DIMENSION_WEIGHTS)
+_DIM_WEIGHTS = tuple(DIMENSION_WEIGHTS.values())
+
 # Source-based fallback scores (when no data available)
 # NOTE: Curated tools should be enriched with Perplexity, not use generic fallbacks
 # Generic fallbacks (vision=80 for all curated) makes no sense - each tool is unique
@@ -63,6 +76,23 @@ SOURCE_FALLBACK_SCORES = {
     "hacker_news": {"buzz": 40, "vision": 45, "ability": 40},
 }
 
+# Threshold ladders: points[bisect(thresholds, value)]
+# bisect_left counts thresholds strictly below the value (for "value > t" tiers),
+# bisect_right counts thresholds <= value (for "value >= t" and "value < t" tiers)
+_DESC_THRESH, _DESC_PTS = (20, 50, 100), (0, 10, 20, 30)                     # description length >
+_COMMIT_THRESH, _COMMIT_PTS = (7, 30, 90), (30, 20, 10, 0)                   # days since last commit <
+_AGE_THRESH, _AGE_PTS = (1, 3, 5), (0, 5, 10, 15)                            # company age >=
+_CUSTOMER_THRESH, _CUSTOMER_PTS = (0, 10, 100), (0, 5, 10, 15)               # customer count >
+_DOWNLOAD_THRESH, _DOWNLOAD_PTS = (1000, 10000, 100000), (0, 10, 20, 30)     # npm + pip downloads >
+_REVIEW_THRESH, _REVIEW_PTS = (10, 100, 1000), (0, 10, 15, 20)               # app store reviews >
+_COMMUNITY_THRESH, _COMMUNITY_PTS = (100, 1000, 10000), (0, 10, 15, 20)      # community + discord >
+
+# Ability points for production status (one dict probe instead of chained ==)
+STATUS_POINTS = {"active": 15, "production": 15, "beta": 10, "alpha": 5}
+
+# Sources that earn media-coverage credibility without explicit mentions
+NEWS_SOURCES = frozenset({"techcrunch", "venturebeat"})
+
 # Minimum scores for curated tools (safety net)
 # Increased to ensure they always pass quality filters (threshold is 30)
 CURATED_MIN_SCORES = {
@@ -71,6 +101,39 @@ CURATED_MIN_SCORES = {
     "ability": 60
 }
 
+# ============================================================================
+# KNOWN COMPANIES (credibility)
+# ============================================================================
+
+# TIER 1: Major AI/Tech Companies (OpenAI, Google, Microsoft, Anthropic, etc.)
+# These are industry leaders with proven track records
+TIER_1_COMPANIES = [
+    'openai', 'google', 'microsoft', 'anthropic', 'meta', 'facebook',
+    'deepmind', 'amazon', 'aws', 'apple', 'nvidia', 'adobe',
+    'salesforce', 'ibm', 'oracle', 'sap', 'stripe'
+]
+
+# TIER 1 PRODUCTS: Famous products from Tier 1 companies
+# Map product name → company for recognition
+TIER_1_PRODUCTS = {
+    'chatgpt': 'openai', 'gpt': 'openai', 'dall-e': 'openai', 'sora': 'openai',
+    'codex': 'openai', 'whisper': 'openai',
+    'claude': 'anthropic',
+    'gemini': 'google', 'bard': 'google', 'notebooklm': 'google',
+    'copilot': 'microsoft', 'bing': 'microsoft', 'azure': 'microsoft',
+    'llama': 'meta', 'whatsapp': 'meta',
+    'alexa': 'amazon', 'aws': 'amazon', 'bedrock': 'amazon',
+    'firefly': 'adobe', 'photoshop': 'adobe'
+}
+
+# TIER 2: Well-funded AI startups and established companies
+TIER_2_COMPANIES = [
+    'runway', 'midjourney', 'stability', 'cohere', 'inflection',
+    'character.ai', 'jasper', 'copy.ai', 'writesonic', 'notion',
+    'github', 'gitlab', 'jetbrains', 'atlassian', 'asana', 'figma',
+    'canva', 'grammarly', 'hubspot', 'bolt', 'stackblitz'
+]
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -83,21 +146,26 @@ def is_curated_tool(tool: Dict) -> bool:
         tool.get("source") == "curated"
     )
 
-def get_fallback_score(tool: Dict, dimension: str) -> float:
-    """Get fallback score based on source when no data available"""
-    source = tool.get("source", "").lower()
+@lru_cache(maxsize=256)
+def _source_fallback_scores(source: str) -> Dict[str, float]:
+    """Fallback table for a raw source string (memoized - only a handful of distinct sources)"""
+    source = source.lower()
     
     # Check exact match first
     if source in SOURCE_FALLBACK_SCORES:
-        return SOURCE_FALLBACK_SCORES[source].get(dimension, 50)
+        return SOURCE_FALLBACK_SCORES[source]
     
     # Check partial match
     for key, scores in SOURCE_FALLBACK_SCORES.items():
         if key in source:
-            return scores.get(dimension, 50)
+            return scores
     
-    # Default fallback
-    return 50
+    return {}
+
+def get_fallback_score(tool: Dict, dimension: str) -> float:
+    """Get fallback score based on source when no data available"""
+    # Default fallback: 50
+    return _source_fallback_scores(tool.get("source", "")).get(dimension, 50)
 
 def has_enriched_data(tool: Dict) -> bool:
     """Check if tool has enriched data (not just basic scraped data)"""
@@ -113,31 +181,62 @@ def has_enriched_data(tool: Dict) -> bool:
     present = sum(1 for field in enriched_fields if tool.get(field))
     return present >= 2
 
+# Boolean "has_*" style fields packed into one int (see get_tool_flags)
+HAS_API_DOCS = 1 << 0
+HAS_DOCUMENTATION = 1 << 1
+HAS_DEMO = 1 << 2
+HAS_PLAYGROUND = 1 << 3
+HAS_SDK = 1 << 4
+HAS_GITHUB_URL = 1 << 5
+HAS_VERSION = 1 << 6
+HAS_LINKEDIN_URL = 1 << 7
+HAS_LINKEDIN = 1 << 8
+HAS_TRENDING = 1 << 9
+
+_FLAG_FIELDS = (
+    ("has_api_docs", HAS_API_DOCS), ("has_documentation", HAS_DOCUMENTATION),
+    ("has_demo", HAS_DEMO), ("has_playground", HAS_PLAYGROUND), ("has_sdk", HAS_SDK),
+    ("github_url", HAS_GITHUB_URL), ("last_known_version", HAS_VERSION),
+    ("linkedin_url", HAS_LINKEDIN_URL), ("has_linkedin", HAS_LINKEDIN),
+    ("trending", HAS_TRENDING),
+)
+
+def get_tool_flags(tool: Dict) -> int:
+    """Pack the truthiness of the boolean-ish tool fields into HAS_* bits"""
+    flags = 0
+    for field, bit in _FLAG_FIELDS:
+        if tool.get(field):
+            flags |= bit
+    return flags
+
 # ============================================================================
 # DIMENSION CALCULATORS (INTELLIGENT FALLBACKS)
 # ============================================================================
 
-def calculate_buzz_score(tool: Dict) -> float:
-    """
-    Calculate buzz/trending momentum (0-100)
-    Smart fallback if no data available
-    """
-    
-    # If curated, check if we have real data or use fallback
-    if is_curated_tool(tool):
-        # Try to calculate with real data first
-        has_data = (
-            tool.get("github_stars", 0) > 0 or
-            tool.get("upvotes", 0) > 0 or
-            tool.get("trending", False)
-        )
-        
-        if not has_data:
-            # Use fallback score
-            fallback = get_fallback_score(tool, "buzz")
-            logger.debug(f"  Curated tool '{tool.get('name')}': using fallback buzz={fallback}")
-            return fallback
-    
+def _manual_score(tool: Dict, dimension: str) -> Optional[float]:
+    """Manual score for a curated tool (highest priority), None if there isn't one"""
+    tool_name = tool.get("name")
+    if tool_name in MANUAL_SCORES and dimension in MANUAL_SCORES[tool_name]:
+        manual = MANUAL_SCORES[tool_name][dimension]
+        logger.debug("  '%s': using manual %s=%s", tool_name, dimension, manual)
+        return manual
+    return None
+
+def _curated_fallback(tool: Dict, dimension: str) -> float:
+    """Curated tool without data for this dimension: use the source fallback as-is"""
+    fallback = get_fallback_score(tool, dimension)
+    logger.debug("  Curated tool '%s': using fallback %s=%s", tool.get('name'), dimension, fallback)
+    return fallback
+
+def _apply_fallback(score: float, tool: Dict, dimension: str) -> float:
+    """If score is still low, use 70% of the source fallback as minimum; cap at 100"""
+    if score < 20:
+        fallback = get_fallback_score(tool, dimension)
+        score = max(score, fallback * 0.7)
+    return min(100, score)
+
+def _buzz_core(tool: Dict, flags: int) -> float:
+    """Raw buzz points from stars, upvotes, social and trending (before fallback)"""
     score = 0.0
     
     # GitHub stars (0-40 points)
@@ -159,54 +258,19 @@ def calculate_buzz_score(tool: Dict) -> float:
     score += social_score
     
     # Recent activity bonus (0-10 points)
-    if tool.get("trending", False):
+    if flags & HAS_TRENDING:
         score += 10
     
-    # If score still very low and we know the source, use fallback
-    if score < 20:
-        fallback = get_fallback_score(tool, "buzz")
-        score = max(score, fallback * 0.7)  # Use 70% of fallback as minimum
-    
-    return min(100, score)
-
-def calculate_vision_score(tool: Dict) -> float:
-    """
-    Calculate product clarity/vision (0-100)
-    Smart fallback if no data available
-    """
-
-    # Check for manual score first (highest priority)
-    tool_name = tool.get("name")
-    if tool_name in MANUAL_SCORES and "vision" in MANUAL_SCORES[tool_name]:
-        manual_vision = MANUAL_SCORES[tool_name]["vision"]
-        logger.debug(f"  '{tool_name}': using manual vision={manual_vision}")
-        return manual_vision
+    return score
 
-    # If curated, check if we have real data or use fallback
-    if is_curated_tool(tool):
-        has_data = (
-            len(tool.get("description", "")) > 50 or
-            tool.get("key_features") or
-            tool.get("has_api_docs")
-        )
-
-        if not has_data:
-            fallback = get_fallback_score(tool, "vision")
-            logger.debug(f"  Curated tool '{tool.get('name')}': using fallback vision={fallback}")
-            return fallback
-    
+def _vision_core(tool: Dict, flags: int) -> float:
+    """Raw vision points from description, features, docs, demo and use cases (before fallback)"""
     score = 0.0
     
     # Description quality (0-30 points)
     description = tool.get("description", "")
     if description:
-        desc_length = len(description)
-        if desc_length > 100:
-            score += 30
-        elif desc_length > 50:
-            score += 20
-        elif desc_length > 20:
-            score += 10
+        score += _DESC_PTS[bisect_left(_DESC_THRESH, len(description))]
     
     # Key features defined (0-25 points)
     features = tool.get("key_features", [])
@@ -215,11 +279,11 @@ def calculate_vision_score(tool: Dict) -> float:
         score += min(25, features_count * 5)
     
     # Documentation exists (0-20 points)
-    if tool.get("has_api_docs") or tool.get("has_documentation"):
+    if flags & (HAS_API_DOCS | HAS_DOCUMENTATION):
         score += 20
     
     # Demo/playground available (0-15 points)
-    if tool.get("has_demo") or tool.get("has_playground"):
+    if flags & (HAS_DEMO | HAS_PLAYGROUND):
         score += 15
     
     # Use cases defined (0-10 points)
@@ -227,82 +291,132 @@ def calculate_vision_score(tool: Dict) -> float:
     if use_cases:
         score += 10
     
-    # If score still low, use fallback
-    if score < 20:
-        fallback = get_fallback_score(tool, "vision")
-        score = max(score, fallback * 0.7)
-    
-    return min(100, score)
-
-def calculate_ability_score(tool: Dict) -> float:
-    """
-    Calculate technical maturity/ability (0-100)
-    Smart fallback if no data available
-    """
-
-    # Check for manual score first (highest priority)
-    tool_name = tool.get("name")
-    if tool_name in MANUAL_SCORES and "ability" in MANUAL_SCORES[tool_name]:
-        manual_ability = MANUAL_SCORES[tool_name]["ability"]
-        logger.debug(f"  '{tool_name}': using manual ability={manual_ability}")
-        return manual_ability
-
-    # If curated, check if we have real data or use fallback
-    if is_curated_tool(tool):
-        has_data = (
-            tool.get("github_url") or
-            tool.get("has_api_docs") or
-            tool.get("last_known_version")
-        )
+    return score
 
-        if not has_data:
-            fallback = get_fallback_score(tool, "ability")
-            logger.debug(f"  Curated tool '{tool.get('name')}': using fallback ability={fallback}")
-            return fallback
-    
+def _ability_core(tool: Dict, flags: int) -> float:
+    """Raw ability points from GitHub health, integrations, API, status and versioning (before fallback)"""
     score = 0.0
     
     # GitHub health (0-30 points)
-    if tool.get("github_url"):
+    if flags & HAS_GITHUB_URL:
         last_commit_days = tool.get("days_since_last_commit", 999)
-        if last_commit_days < 7:
-            score += 30
-        elif last_commit_days < 30:
-            score += 20
-        elif last_commit_days < 90:
-            score += 10
+        score += _COMMIT_PTS[bisect_right(_COMMIT_THRESH, last_commit_days)]
     
     # Integration count (0-25 points)
     integrations = tool.get("num_integrations", 0)
     score += min(25, integrations * 2.5)
     
     # Has stable API (0-20 points)
-    if tool.get("has_api_docs") or tool.get("has_sdk"):
+    if flags & (HAS_API_DOCS | HAS_SDK):
         score += 20
     
     # Production status (0-15 points)
-    status = tool.get("status", "").lower()
-    if status == "active" or status == "production":
-        score += 15
-    elif status == "beta":
-        score += 10
-    elif status == "alpha":
-        score += 5
+    score += STATUS_POINTS.get(tool.get("status", "").lower(), 0)
     
     # Has versioning (0-10 points)
-    if tool.get("last_known_version"):
+    if flags & HAS_VERSION:
         score += 10
     
-    # If score still low, use fallback
-    if score < 20:
-        fallback = get_fallback_score(tool, "ability")
-        score = max(score, fallback * 0.7)
+    return score
+
+def calculate_buzz_score(tool: Dict, curated: Optional[bool] = None,
+                         flags: Optional[int] = None) -> float:
+    """
+    Calculate buzz/trending momentum (0-100)
+    Smart fallback if no data available
+    curated / flags: precomputed is_curated_tool(tool) / get_tool_flags(tool), recomputed when omitted
+    """
+    if curated is None:
+        curated = is_curated_tool(tool)
+    if flags is None:
+        flags = get_tool_flags(tool)
     
-    return min(100, score)
+    # If curated, check if we have real data or use fallback
+    if curated:
+        has_data = (
+            tool.get("github_stars", 0) > 0 or
+            tool.get("upvotes", 0) > 0 or
+            flags & HAS_TRENDING
+        )
+        if not has_data:
+            return _curated_fallback(tool, "buzz")
+    
+    return _apply_fallback(_buzz_core(tool, flags), tool, "buzz")
+
+def calculate_vision_score(tool: Dict, curated: Optional[bool] = None,
+                           flags: Optional[int] = None) -> float:
+    """
+    Calculate product clarity/vision (0-100)
+    Smart fallback if no data available
+    curated / flags: precomputed is_curated_tool(tool) / get_tool_flags(tool), recomputed when omitted
+    """
+    manual = _manual_score(tool, "vision")
+    if manual is not None:
+        return manual
 
-def calculate_credibility_score(tool: Dict) -> float:
+    if curated is None:
+        curated = is_curated_tool(tool)
+    if flags is None:
+        flags = get_tool_flags(tool)
+    
+    # If curated, check if we have real data or use fallback
+    if curated:
+        has_data = (
+            len(tool.get("description", "")) > 50 or
+            tool.get("key_features") or
+            flags & HAS_API_DOCS
+        )
+        if not has_data:
+            return _curated_fallback(tool, "vision")
+    
+    return _apply_fallback(_vision_core(tool, flags), tool, "vision")
+
+def calculate_ability_score(tool: Dict, curated: Optional[bool] = None,
+                            flags: Optional[int] = None) -> float:
+    """
+    Calculate technical maturity/ability (0-100)
+    Smart fallback if no data available
+    curated / flags: precomputed is_curated_tool(tool) / get_tool_flags(tool), recomputed when omitted
+    """
+    manual = _manual_score(tool, "ability")
+    if manual is not None:
+        return manual
+
+    if curated is None:
+        curated = is_curated_tool(tool)
+    if flags is None:
+        flags = get_tool_flags(tool)
+    
+    # If curated, check if we have real data or use fallback
+    if curated:
+        has_data = flags & (HAS_GITHUB_URL | HAS_API_DOCS | HAS_VERSION)
+        if not has_data:
+            return _curated_fallback(tool, "ability")
+    
+    return _apply_fallback(_ability_core(tool, flags), tool, "ability")
+
+@lru_cache(maxsize=256)
+def _funding_points(funding_stage: str) -> int:
+    """Credibility points for a raw funding_stage string (memoized - few distinct values)"""
+    funding = funding_stage.lower()
+    if "series" in funding:
+        if "c" in funding or "d" in funding:
+            return 30
+        elif "b" in funding:
+            return 25
+        elif "a" in funding:
+            return 20
+    elif "seed" in funding:
+        return 15
+    return 0
+
+def calculate_credibility_score(tool: Dict, curated: Optional[bool] = None,
+                                current_year: Optional[int] = None,
+                                flags: Optional[int] = None) -> float:
     """
     Calculate team/company credibility (0-100)
+    current_year: pass it in when scoring in bulk (defaults to datetime.now().year)
+    flags: precomputed get_tool_flags(tool), recomputed when omitted
 
     SMART FALLBACK: Recognize major tech companies by publisher name
     This fixes the issue where OpenAI's Sora gets credibility=10 which is absurd
@@ -310,35 +424,6 @@ def calculate_credibility_score(tool: Dict) -> float:
 
     score = 0.0
 
-    # TIER 1: Major AI/Tech Companies (OpenAI, Google, Microsoft, Anthropic, etc.)
-    # These are industry leaders with proven track records
-    TIER_1_COMPANIES = [
-        'openai', 'google', 'microsoft', 'anthropic', 'meta', 'facebook',
-        'deepmind', 'amazon', 'aws', 'apple', 'nvidia', 'adobe',
-        'salesforce', 'ibm', 'oracle', 'sap', 'stripe'
-    ]
-
-    # TIER 1 PRODUCTS: Famous products from Tier 1 companies
-    # Map product name → company for recognition
-    TIER_1_PRODUCTS = {
-        'chatgpt': 'openai', 'gpt': 'openai', 'dall-e': 'openai', 'sora': 'openai',
-        'codex': 'openai', 'whisper': 'openai',
-        'claude': 'anthropic',
-        'gemini': 'google', 'bard': 'google', 'notebooklm': 'google',
-        'copilot': 'microsoft', 'bing': 'microsoft', 'azure': 'microsoft',
-        'llama': 'meta', 'whatsapp': 'meta',
-        'alexa': 'amazon', 'aws': 'amazon', 'bedrock': 'amazon',
-        'firefly': 'adobe', 'photoshop': 'adobe'
-    }
-
-    # TIER 2: Well-funded AI startups and established companies
-    TIER_2_COMPANIES = [
-        'runway', 'midjourney', 'stability', 'cohere', 'inflection',
-        'character.ai', 'jasper', 'copy.ai', 'writesonic', 'notion',
-        'github', 'gitlab', 'jetbrains', 'atlassian', 'asana', 'figma',
-        'canva', 'grammarly', 'hubspot', 'bolt', 'stackblitz'
-    ]
-
     publisher = tool.get("publisher", "").lower()
     tool_name = tool.get("name", "").lower()
 
@@ -348,7 +433,7 @@ def calculate_credibility_score(tool: Dict) -> float:
 
     # Check if tool name matches a known TIER 1 product
     if not tier_1_match:
-        for product, company in TIER_1_PRODUCTS.items():
+        for product in TIER_1_PRODUCTS:
             if product in tool_name:
                 tier_1_match = True
                 break
@@ -361,49 +446,34 @@ def calculate_credibility_score(tool: Dict) -> float:
         score += 70  # Major tech company = instant high credibility
     elif tier_2_match:
         score += 50  # Well-known AI startup = good credibility
-    elif is_curated_tool(tool):
+    elif curated if curated is not None else is_curated_tool(tool):
         score += 40  # Curated but unknown company
 
     # Funding stage (0-30 points) - bonus on top of base
-    funding = tool.get("funding_stage", "").lower()
-    if "series" in funding:
-        if "c" in funding or "d" in funding:
-            score += 30
-        elif "b" in funding:
-            score += 25
-        elif "a" in funding:
-            score += 20
-    elif "seed" in funding:
-        score += 15
+    score += _funding_points(tool.get("funding_stage", ""))
 
     # Company age (0-15 points) - reduced from 20
     founding_year = tool.get("founding_year", 0)
     if founding_year > 0:
-        age = datetime.now().year - founding_year
-        if age >= 5:
-            score += 15
-        elif age >= 3:
-            score += 10
-        elif age >= 1:
-            score += 5
+        if current_year is None:
+            current_year = datetime.now().year
+        age = current_year - founding_year
+        score += _AGE_PTS[bisect_right(_AGE_THRESH, age)]
 
     # Has LinkedIn company page (0-10 points) - reduced from 15
-    if tool.get("linkedin_url") or tool.get("has_linkedin"):
+    if flags is None:
+        flags = get_tool_flags(tool)
+    if flags & (HAS_LINKEDIN_URL | HAS_LINKEDIN):
         score += 10
 
     # Customer testimonials/case studies (0-15 points) - reduced from 20
     testimonials = tool.get("customer_count", 0)
-    if testimonials > 100:
-        score += 15
-    elif testimonials > 10:
-        score += 10
-    elif testimonials > 0:
-        score += 5
+    score += _CUSTOMER_PTS[bisect_left(_CUSTOMER_THRESH, testimonials)]
 
     # Media coverage (0-10 points) - reduced from 15
     if tool.get("media_mentions", 0) > 0:
         score += 10
-    elif tool.get("source") in ["techcrunch", "venturebeat"]:
+    elif tool.get("source") in NEWS_SOURCES:
         score += 5
 
     return min(100, score)
@@ -416,41 +486,24 @@ def calculate_adoption_score(tool: Dict) -> float:
     # GitHub dependents (0-30 points)
     dependents = tool.get("github_dependents", 0)
     if dependents > 0:
-        dep_score = min(30, 5 * (dependents ** 0.5))
+        dep_score = min(30, 5 * math.sqrt(dependents))
         score += dep_score
     
     # Package downloads (0-30 points)
     npm_downloads = tool.get("npm_downloads", 0)
     pip_downloads = tool.get("pip_downloads", 0)
     total_downloads = npm_downloads + pip_downloads
-    
-    if total_downloads > 100000:
-        score += 30
-    elif total_downloads > 10000:
-        score += 20
-    elif total_downloads > 1000:
-        score += 10
+    score += _DOWNLOAD_PTS[bisect_left(_DOWNLOAD_THRESH, total_downloads)]
     
     # App store reviews (0-20 points)
     app_reviews = tool.get("app_store_reviews", 0)
-    if app_reviews > 1000:
-        score += 20
-    elif app_reviews > 100:
-        score += 15
-    elif app_reviews > 10:
-        score += 10
+    score += _REVIEW_PTS[bisect_left(_REVIEW_THRESH, app_reviews)]
     
     # Community size (0-20 points)
     community_size = tool.get("community_size", 0)
     discord_members = tool.get("discord_members", 0)
     total_community = community_size + discord_members
-    
-    if total_community > 10000:
-        score += 20
-    elif total_community > 1000:
-        score += 15
-    elif total_community > 100:
-        score += 10
+    score += _COMMUNITY_PTS[bisect_left(_COMMUNITY_THRESH, total_community)]
     
     return min(100, score)
 
@@ -458,30 +511,121 @@ def calculate_adoption_score(tool: Dict) -> float:
 # CURATED TOOLS SAFETY NET
 # ============================================================================
 
-def apply_curated_safety_net(tool: Dict) -> None:
+_MIN_BUZZ = CURATED_MIN_SCORES["buzz_score"]
+_MIN_VISION = CURATED_MIN_SCORES["vision"]
+_MIN_ABILITY = CURATED_MIN_SCORES["ability"]
+
+def apply_curated_safety_net(tool: Dict, curated: Optional[bool] = None) -> None:
     """
     Apply minimum scores for curated tools to ensure they pass filters
     Modifies tool dict in-place
+    curated: precomputed is_curated_tool(tool), recomputed when omitted
     """
-    if not is_curated_tool(tool):
+    if curated is None:
+        curated = is_curated_tool(tool)
+    if not curated:
         return
     
-    modified = []
+    buzz = tool.get("buzz_score", 0)
+    vision = tool.get("vision", 0)
+    ability = tool.get("ability", 0)
     
-    for dimension, min_score in CURATED_MIN_SCORES.items():
-        current_score = tool.get(dimension, 0)
-        if current_score < min_score:
-            tool[dimension] = min_score
-            modified.append(f"{dimension}={current_score:.0f}→{min_score}")
+    # Common case: already above every minimum
+    if buzz >= _MIN_BUZZ and vision >= _MIN_VISION and ability >= _MIN_ABILITY:
+        return
     
-    if modified:
+    if buzz < _MIN_BUZZ:
+        tool["buzz_score"] = _MIN_BUZZ
+    if vision < _MIN_VISION:
+        tool["vision"] = _MIN_VISION
+    if ability < _MIN_ABILITY:
+        tool["ability"] = _MIN_ABILITY
+    
+    if logger.isEnabledFor(logging.INFO):
+        modified = [
+            f"{dimension}={current:.0f}→{minimum}"
+            for dimension, current, minimum in (
+                ("buzz_score", buzz, _MIN_BUZZ), ("vision", vision, _MIN_VISION), ("ability", ability, _MIN_ABILITY)
+            )
+            if current < minimum
+        ]
         logger.info(f"  🛡️  Safety net for '{tool.get('name')}': {', '.join(modified)}")
 
 # ============================================================================
 # MAIN SCORING FUNCTION (For final scoring with multipliers)
 # ============================================================================
 
-def calculate_enhanced_score(tool: Dict) -> Dict:
+def _has_dimension_data(tool: Dict, flags: int) -> bool:
+    """
+    True if any of buzz/vision/ability has real data to score
+    (union of the curated has_data checks in the three calculators)
+    """
+    return bool(
+        flags & (HAS_TRENDING | HAS_API_DOCS | HAS_GITHUB_URL | HAS_VERSION) or
+        tool.get("github_stars", 0) > 0 or
+        tool.get("upvotes", 0) > 0 or
+        len(tool.get("description", "")) > 50 or
+        tool.get("key_features")
+    )
+
+def get_dimension_scores(tool: Dict, curated: Optional[bool] = None,
+                         current_year: Optional[int] = None,
+                         flags: Optional[int] = None) -> Dict[str, float]:
+    """
+    Dimension scores used by the final score
+    Uses EXISTING buzz_score/vision/ability if available (from filtering phase);
+    only credibility and adoption are always recalculated (not used in filtering)
+    """
+    if curated is None:
+        curated = is_curated_tool(tool)
+    if flags is None:
+        flags = get_tool_flags(tool)
+    
+    buzz = tool.get("buzz_score")
+    vision = tool.get("vision")
+    ability = tool.get("ability")
+    
+    if buzz is None or vision is None or ability is None:
+        if curated and not _has_dimension_data(tool, flags):
+            # Fast path: a bare curated tool gets source fallbacks (or manual scores) directly
+            fallbacks = _source_fallback_scores(tool.get("source", ""))
+            manual = MANUAL_SCORES.get(tool.get("name"), {})
+            if buzz is None:
+                buzz = fallbacks.get("buzz", 50)
+            if vision is None:
+                vision = manual["vision"] if "vision" in manual else fallbacks.get("vision", 50)
+            if ability is None:
+                ability = manual["ability"] if "ability" in manual else fallbacks.get("ability", 50)
+            logger.debug("  Curated tool '%s': no data, using fallback scores", tool.get('name'))
+        else:
+            if buzz is None:
+                buzz = calculate_buzz_score(tool, curated, flags)
+            if vision is None:
+                vision = calculate_vision_score(tool, curated, flags)
+            if ability is None:
+                ability = calculate_ability_score(tool, curated, flags)
+    
+    return {
+        "buzz": buzz,
+        "vision": vision,
+        "ability": ability,
+        "credibility": calculate_credibility_score(tool, curated, current_year, flags),
+        "adoption": calculate_adoption_score(tool)
+    }
+
+class ScoringResult(NamedTuple):
+    """Detailed breakdown returned by calculate_enhanced_score"""
+    final_score: float
+    base_score: float
+    dimension_scores: Dict[str, float]
+    confidence_level: int
+    confidence_multiplier: float
+    source_multiplier: float
+    maturity_adjustment: float
+    penalties: List[str]
+    bonuses: List[str]
+
+def calculate_enhanced_score(tool: Dict, current_year: Optional[int] = None) -> ScoringResult:
     """
     Calculate enhanced score with confidence weighting
     This is for the FINAL scoring with multipliers (MODULE 3)
@@ -492,29 +636,26 @@ def calculate_enhanced_score(tool: Dict) -> Dict:
     """
 
     tool_name = tool.get("name", "Unknown")
+    curated = is_curated_tool(tool)
+    flags = get_tool_flags(tool)
 
-    # Use EXISTING dimension scores if available (from filtering phase)
-    # Only recalculate credibility and adoption (not used in filtering)
-    dimension_scores = {
-        "buzz": tool.get("buzz_score") if tool.get("buzz_score") is not None else calculate_buzz_score(tool),
-        "vision": tool.get("vision") if tool.get("vision") is not None else calculate_vision_score(tool),
-        "ability": tool.get("ability") if tool.get("ability") is not None else calculate_ability_score(tool),
-        "credibility": calculate_credibility_score(tool),
-        "adoption": calculate_adoption_score(tool)
-    }
+    dimension_scores = get_dimension_scores(tool, curated, current_year, flags)
     
     # Calculate weighted base score
     base_score = sum(
-        dimension_scores[dim] * DIMENSION_WEIGHTS[dim]
-        for dim in DIMENSION_WEIGHTS
+        dimension_scores[dim] * weight
+        for dim, weight in zip(_DIM_ORDER, _DIM_WEIGHTS)
     )
 
     # Apply SMART confidence multiplier (based on data richness, not arbitrary)
-    confidence_level = calculate_smart_confidence(tool)
+    confidence_level = calculate_smart_confidence(tool, curated)
     confidence_multiplier = get_confidence_multiplier(confidence_level)
     
+    # Name + description text, lowercased once for all keyword checks
+    text_lower = get_tool_text(tool)
+    
     # Apply maturity penalties/bonuses
-    maturity_adjustment = calculate_maturity_adjustment(tool)
+    maturity_adjustment = calculate_maturity_adjustment(tool, text_lower)
     
     # Apply source credibility
     source_multiplier = get_source_multiplier(tool.get("source", ""))
@@ -526,19 +667,19 @@ def calculate_enhanced_score(tool: Dict) -> Dict:
     final_score = max(0, min(100, final_score))
     
     # Prepare detailed breakdown
-    result = {
-        "final_score": round(final_score, 2),
-        "base_score": round(base_score, 2),
-        "dimension_scores": {k: round(v, 2) for k, v in dimension_scores.items()},
-        "confidence_level": confidence_level,
-        "confidence_multiplier": confidence_multiplier,
-        "source_multiplier": source_multiplier,
-        "maturity_adjustment": maturity_adjustment,
-        "penalties": get_penalties(tool),
-        "bonuses": get_bonuses(tool)
-    }
+    result = ScoringResult(
+        final_score=round(final_score, 2),
+        base_score=round(base_score, 2),
+        dimension_scores={k: round(v, 2) for k, v in dimension_scores.items()},
+        confidence_level=confidence_level,
+        confidence_multiplier=confidence_multiplier,
+        source_multiplier=source_multiplier,
+        maturity_adjustment=maturity_adjustment,
+        penalties=get_penalties(tool, text_lower),
+        bonuses=get_bonuses(tool)
+    )
     
-    logger.debug(f"  📊 {tool_name}: {final_score:.1f} (base={base_score:.1f})")
+    logger.debug("  📊 %s: %.1f (base=%.1f)", tool_name, final_score, base_score)
     
     return result
 
@@ -551,19 +692,38 @@ def calculate_enhanced_score(tool: Dict) -> Dict:
 # New: low=0.85 (-15% penalty) is more reasonable
 CONFIDENCE_MULTIPLIERS = {"high": 1.0, "medium": 0.95, "low": 0.85}
 MATURITY_BONUSES = {"production": 10, "beta": -5, "alpha": -10, "experimental": -15}
+
+# Maturity keywords found in name + description (bitmask from _scan_keywords)
+KW_PRODUCTION = 1 << 0
+KW_BETA = 1 << 1          # substring anywhere
+KW_BETA_WORD = 1 << 2     # whole word
+KW_ALPHA = 1 << 3
+KW_ALPHA_WORD = 1 << 4
+KW_EXPERIMENTAL = 1 << 5
+KW_PROTOTYPE = 1 << 6
+
+_KEYWORD_BITS = {
+    "production": (KW_PRODUCTION, 0), "beta": (KW_BETA, KW_BETA_WORD),
+    "alpha": (KW_ALPHA, KW_ALPHA_WORD), "experimental": (KW_EXPERIMENTAL, 0),
+    "prototype": (KW_PROTOTYPE, 0),
+}
+# Zero-width lookahead so overlapping hits ("betalpha") are all reported in one pass
+_KEYWORD_RE = re.compile(r'(?=(production|experimental|prototype|beta|alpha))')
 SOURCE_CREDIBILITY = {
     "curated": 1.2, "curated_list": 1.2, "official_blog": 1.15, "techcrunch": 1.1,
     "venturebeat": 1.1, "product_hunt": 1.05, "github": 1.0, "github_trending": 1.0,
     "reddit": 0.8, "hn": 0.85
 }
 
-def calculate_smart_confidence(tool: Dict) -> int:
+def calculate_smart_confidence(tool: Dict, curated: Optional[bool] = None) -> int:
     """
     Calculate confidence based on data richness instead of arbitrary source
     This gives fair scores to well-enriched tools even if not curated
     """
     # Curated tools always get 100
-    if is_curated_tool(tool):
+    if curated is None:
+        curated = is_curated_tool(tool)
+    if curated:
         return 100
 
     # Start with existing confidence_level or baseline
@@ -592,37 +752,72 @@ def get_confidence_multiplier(confidence_level: int) -> float:
     else:
         return CONFIDENCE_MULTIPLIERS["low"]
 
+@lru_cache(maxsize=256)
 def get_source_multiplier(source: str) -> float:
+    """Multiplier for the first SOURCE_CREDIBILITY key found in the source (memoized)"""
     source_lower = source.lower()
     for key, multiplier in SOURCE_CREDIBILITY.items():
         if key in source_lower:
             return multiplier
     return 1.0
 
-def calculate_maturity_adjustment(tool: Dict) -> float:
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+def get_tool_text(tool: Dict) -> str:
+    """Lowercased name + description, the text keyword checks run against"""
+    return (tool.get("name", "") + " " + tool.get("description", "")).lower()
+
+@lru_cache(maxsize=1024)
+def _scan_keywords(text: str) -> int:
+    """
+    Single pass over lowercased text for all maturity keywords
+    Returns KW_* bits; beta/alpha also get a *_WORD bit when they stand as a whole word
+    Memoized so maturity + penalties on the same text share one scan
+    """
+    found = 0
+    end = len(text)
+    for match in _KEYWORD_RE.finditer(text):
+        keyword = match.group(1)
+        bit, word_bit = _KEYWORD_BITS[keyword]
+        found |= bit
+        if word_bit:
+            start = match.start()
+            stop = start + len(keyword)
+            if (start == 0 or not _is_word_char(text[start - 1])) and \
+               (stop == end or not _is_word_char(text[stop])):
+                found |= word_bit
+    return found
+
+def calculate_maturity_adjustment(tool: Dict, text_lower: Optional[str] = None) -> float:
     adjustment = 0.0
-    text = (tool.get("name", "") + " " + tool.get("description", "")).lower()
+    if text_lower is None:
+        text_lower = get_tool_text(tool)
+    keywords = _scan_keywords(text_lower)
+    status = tool.get("status")
     
-    if "production" in text or tool.get("status") == "production":
+    if keywords & KW_PRODUCTION or status == "production":
         adjustment += MATURITY_BONUSES["production"]
-    if re.search(r'\bbeta\b', text) or tool.get("status") == "beta":
+    if keywords & KW_BETA_WORD or status == "beta":
         adjustment += MATURITY_BONUSES["beta"]
-    if re.search(r'\balpha\b', text) or tool.get("status") == "alpha":
+    if keywords & KW_ALPHA_WORD or status == "alpha":
         adjustment += MATURITY_BONUSES["alpha"]
-    if "experimental" in text or "prototype" in text:
+    if keywords & (KW_EXPERIMENTAL | KW_PROTOTYPE):
         adjustment += MATURITY_BONUSES["experimental"]
     
     return adjustment
 
-def get_penalties(tool: Dict) -> List[str]:
+def get_penalties(tool: Dict, text_lower: Optional[str] = None) -> List[str]:
     penalties = []
-    text = (tool.get("name", "") + " " + tool.get("description", "")).lower()
+    if text_lower is None:
+        text_lower = get_tool_text(tool)
+    keywords = _scan_keywords(text_lower)
     
-    if "beta" in text:
+    if keywords & KW_BETA:
         penalties.append("Beta stage (-5 pts)")
-    if "alpha" in text:
+    if keywords & KW_ALPHA:
         penalties.append("Alpha stage (-10 pts)")
-    if "experimental" in text:
+    if keywords & KW_EXPERIMENTAL:
         penalties.append("Experimental (-15 pts)")
     
     confidence = tool.get("confidence_level", 50)
@@ -660,6 +855,9 @@ def get_bonuses(tool: Dict) -> List[str]:
 # BATCH PROCESSING
 # ============================================================================
 
+# Below this many tools, process start-up and pickling cost more than they save
+PARALLEL_MIN_TOOLS = 2000
+
 def get_gartner_quadrant(vision: float, ability: float) -> str:
     """
     Determine Gartner Magic Quadrant based on vision (X-axis) and ability (Y-axis)
@@ -710,27 +908,56 @@ def ensure_unique_scores(tools: List[Dict]) -> None:
                 tool["ability"] = min(100, ability + jitter)
 
             seen_combinations[key] = jitter_count + 1
-            logger.debug(f"  🔀 Adjusted '{tool.get('name')}' to avoid duplicate ({vision}, {ability})")
+            logger.debug("  🔀 Adjusted '%s' to avoid duplicate (%s, %s)", tool.get('name'), vision, ability)
         else:
             seen_combinations[key] = 1
 
-def score_all_tools(tools: List[Dict]) -> List[Dict]:
-    """Score all tools and add scoring metadata"""
+def _score_chunk(chunk: List[Dict], current_year: int) -> List[ScoringResult]:
+    """Worker body: calculate_enhanced_score is pure, so chunks score independently"""
+    return [calculate_enhanced_score(tool, current_year) for tool in chunk]
 
-    logger.info(f"\n📊 Scoring {len(tools)} tools with Enhanced Scoring v4...\n")
+def _score_tools(tools: List[Dict], current_year: int) -> List[ScoringResult]:
+    """
+    calculate_enhanced_score for every tool, in input order
+    Large batches are split across a process pool (one chunk per CPU)
+    """
+    workers = os.cpu_count() or 1
+    if len(tools) < PARALLEL_MIN_TOOLS or workers < 2:
+        return _score_chunk(tools, current_year)
+
+    chunk_size = -(-len(tools) // workers)
+    chunks = [tools[i:i + chunk_size] for i in range(0, len(tools), chunk_size)]
+    try:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            results = []
+            for part in pool.map(_score_chunk, chunks, repeat(current_year, len(chunks))):
+                results.extend(part)
+            return results
+    except Exception as e:
+        logger.warning(f"⚠️  Parallel scoring failed, scoring serially: {e}")
+        return _score_chunk(tools, current_year)
+
+def score_all_tools(tools: List[Dict], sort: bool = False) -> List[Dict]:
+    """
+    Score all tools and add scoring metadata
+    sort: reorder tools in place by final_score (descending, stable) - otherwise input order is kept
+    """
 
-    for tool in tools:
-        scoring_result = calculate_enhanced_score(tool)
+    logger.info("\n📊 Scoring %d tools with Enhanced Scoring v4...\n", len(tools))
+
+    current_year = datetime.now().year
 
-        tool["final_score"] = scoring_result["final_score"]
-        tool["base_score"] = scoring_result["base_score"]
-        tool["scoring_breakdown"] = scoring_result["dimension_scores"]
+    for tool, scoring_result in zip(tools, _score_tools(tools, current_year)):
+
+        tool["final_score"] = scoring_result.final_score
+        tool["base_score"] = scoring_result.base_score
+        tool["scoring_breakdown"] = scoring_result.dimension_scores
         tool["scoring_metadata"] = {
-            "confidence_multiplier": scoring_result["confidence_multiplier"],
-            "source_multiplier": scoring_result["source_multiplier"],
-            "maturity_adjustment": scoring_result["maturity_adjustment"],
-            "penalties": scoring_result["penalties"],
-            "bonuses": scoring_result["bonuses"]
+            "confidence_multiplier": scoring_result.confidence_multiplier,
+            "source_multiplier": scoring_result.source_multiplier,
+            "maturity_adjustment": scoring_result.maturity_adjustment,
+            "penalties": scoring_result.penalties,
+            "bonuses": scoring_result.bonuses
         }
 
         # Calculate Gartner quadrant from vision (X-axis) and ability (Y-axis)
@@ -739,26 +966,39 @@ def score_all_tools(tools: List[Dict]) -> List[Dict]:
     # Ensure all vision/ability combinations are unique
     ensure_unique_scores(tools)
 
-    # Sort by final score (descending)
-    tools.sort(key=lambda x: x.get("final_score", 0), reverse=True)
+    if sort:
+        # Sort by final score (descending) - stable argsort keeps input order for ties
+        final_scores = np.fromiter((t.get("final_score", 0) for t in tools), dtype=np.float64, count=len(tools))
+        order = np.argsort(-final_scores, kind="stable")
+        tools[:] = [tools[i] for i in order]
 
-    # Log top 10
-    logger.info(f"\n🏆 TOP 10 TOOLS:")
-    for i, tool in enumerate(tools[:10], 1):
-        logger.info(f"   {i}. {tool.get('name')} - {tool.get('final_score', 0):.1f} pts ({tool.get('gartner_quadrant')})")
+    if logger.isEnabledFor(logging.INFO):
+        if sort:
+            top_tools = tools[:10]
+        else:
+            # Top 10 only: O(n) selection, then order just those 10 (ties by input position)
+            final_scores = np.fromiter((t.get("final_score", 0) for t in tools), dtype=np.float64, count=len(tools))
+            if len(tools) > 10:
+                top_idx = np.argpartition(-final_scores, 9)[:10]
+                top_idx = top_idx[np.lexsort((top_idx, -final_scores[top_idx]))]
+            else:
+                top_idx = np.argsort(-final_scores, kind="stable")
+            top_tools = [tools[j] for j in top_idx.tolist()]
 
-    # Log Gartner quadrant distribution
-    quadrant_counts = {}
-    for tool in tools:
-        quadrant = tool.get("gartner_quadrant", "Unknown")
-        quadrant_counts[quadrant] = quadrant_counts.get(quadrant, 0) + 1
+        # Log top 10
+        logger.info("\n🏆 TOP 10 TOOLS:")
+        for i, tool in enumerate(top_tools, 1):
+            logger.info("   %d. %s - %.1f pts (%s)",
+                        i, tool.get('name'), tool.get('final_score', 0), tool.get('gartner_quadrant'))
+
+        # Log Gartner quadrant distribution
+        quadrant_counts = Counter(tool.get("gartner_quadrant", "Unknown") for tool in tools)
 
-    logger.info(f"\n📊 GARTNER QUADRANT DISTRIBUTION:")
-    for quadrant in ["Leader", "Challenger", "Visionary", "Niche Player"]:
-        count = quadrant_counts.get(quadrant, 0)
-        logger.info(f"   {quadrant}: {count} tools")
+        logger.info("\n📊 GARTNER QUADRANT DISTRIBUTION:")
+        for quadrant in ["Leader", "Challenger", "Visionary", "Niche Player"]:
+            logger.info("   %s: %d tools", quadrant, quadrant_counts[quadrant])
 
-    logger.info(f"\n✅ Scoring complete\n")
+    logger.info("\n✅ Scoring complete\n")
 
     return tools
 
@@ -775,6 +1015,7 @@ __all__ = [
     'apply_curated_safety_net',
     'calculate_smart_confidence',
     'calculate_enhanced_score',
+    'ScoringResult',
     'get_gartner_quadrant',
     'score_all_tools',
 ]
\ No newline at end of file
@@ -1,21 +1,58 @@
 #!/usr/bin/env python3
 import json
+import mmap
 import os
-from datetime import datetime
+import sys
+from collections import Counter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Below this size a plain read() beats mmap setup cost
+MMAP_MIN_SIZE = 64 * 1024
+
+def load_tools(path):
+    """Parse the tracker JSON (orjson on raw bytes when available, mmapped for large files)"""
+    with open(path, "rb") as f:
+        if orjson is None:
+            return json.loads(f.read())
+        if os.fstat(f.fileno()).st_size <= MMAP_MIN_SIZE:
+            return orjson.loads(f.read())
+        
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
+        finally:
+            mm.close()
+
+# Quadrant rules: quadrant -> (score field, label, exclusive max)
+VISIONARY_MAX_ABILITY = 50
+CHALLENGER_MAX_VISION = 50
+QUADRANT_LIMITS = {
+    "Visionary": ("ability", "Ability", VISIONARY_MAX_ABILITY),
+    "Challenger": ("vision", "Vision", CHALLENGER_MAX_VISION),
+}
 
 def validate_gartner_rules(tools):
+    """Check quadrant/score rules in one pass - returns (violations, quadrant Counter)"""
     violations = []
+    quadrants = Counter()
     
     for tool in tools:
         v = tool.get("vision", 0)
         a = tool.get("ability", 0)
         q = tool.get("quadrant", "")
+        quadrants[q] += 1
         
-        if q == "Visionary" and a >= 50:
-            violations.append(f"ERROR: {tool['name']}: Visionary but Ability={a} (must be <50)")
-        
-        if q == "Challenger" and v >= 50:
-            violations.append(f"ERROR: {tool['name']}: Challenger but Vision={v} (must be <50)")
+        limit = QUADRANT_LIMITS.get(q)
+        if limit is not None:
+            field, label, max_value = limit
+            value = tool.get(field, 0)
+            if value >= max_value:
+                violations.append(f"ERROR: {tool['name']}: {q} but {label}={value} (must be <{max_value})")
         
         if not (0 <= v <= 100):
             violations.append(f"ERROR: {tool['name']}: Vision={v} (out of bounds 0-100)")
@@ -23,7 +60,7 @@ def validate_gartner_rules(tools):
         if not (0 <= a <= 100):
             violations.append(f"ERROR: {tool['name']}: Ability={a} (out of bounds 0-100)")
     
-    return violations
+    return violations, quadrants
 
 def main():
     print("AI Tracker - Pipeline Validation")
@@ -32,38 +69,33 @@ def main():
     json_file = "public/ai_tracker_enhanced.json"
     
     try:
-        with open(json_file, "r", encoding="utf-8") as f:
-            tools = json.load(f)
+        tools = load_tools(json_file)
         
         print(f"OK JSON loaded: {len(tools)} tools")
         
-        violations = validate_gartner_rules(tools)
+        violations, quadrants = validate_gartner_rules(tools)
         
         if violations:
             print("\nViolations found:")
-            for v in violations:
-                print(v)
-            exit(1)
+            sys.stdout.write("\n".join(violations) + "\n")
+            sys.exit(1)
         else:
             print("OK All Gartner rules validated!")
         
-        leaders = len([t for t in tools if t.get("quadrant") == "Leader"])
-        visionaries = len([t for t in tools if t.get("quadrant") == "Visionary"])
-        challengers = len([t for t in tools if t.get("quadrant") == "Challenger"])
-        niche = len([t for t in tools if t.get("quadrant") == "Niche"])
-        
-        print("\nDistribution:")
-        print(f"   Leaders: {leaders}")
-        print(f"   Visionaries: {visionaries}")
-        print(f"   Challengers: {challengers}")
-        print(f"   Niche: {niche}")
-        print(f"   TOTAL: {len(tools)}")
+        print("\n".join([
+            "\nDistribution:",
+            f"   Leaders: {quadrants['Leader']}",
+            f"   Visionaries: {quadrants['Visionary']}",
+            f"   Challengers: {quadrants['Challenger']}",
+            f"   Niche: {quadrants['Niche']}",
+            f"   TOTAL: {len(tools)}",
+        ]))
         
         print("\nOK Pipeline completed successfully!")
         
     except Exception as e:
         print(f"ERROR: {e}")
-        exit(1)
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()